@@ -16,11 +16,16 @@
 # under the License.
 
 import math
+import operator
 import struct
 import sys
+from typing import Callable, Dict, Tuple
 
 import mmh3
+import numpy as np
+import pyarrow as pa
 
+from .murmur3_util import Murmur3Util
 from .transform import Transform
 from .transform_util import TransformUtil
 from ..expressions import (Expressions,
@@ -28,46 +33,73 @@ from ..expressions import (Expressions,
                            Operation)
 from ..types.types import (IntegerType,
                            TypeID)
-from ...api.types.conversions import Conversions
+
+LONG_STRUCT = struct.Struct("q")
+DOUBLE_STRUCT = struct.Struct("d")
+# the 16 byte big-endian form of a UUID
+UUID_BYTES = operator.attrgetter("bytes")
 
 
 class Bucket(Transform):
+    # the spec defines bucket values with 32-bit Murmur3 (x86 variant, seed 0); swapping in a faster
+    # hash would change the on-disk partition values, so every bucket code path must stay on Murmur3
     MURMUR3 = mmh3
+    APPLY_FUNCS: Dict[Tuple[type, int], Callable] = {}
+    INSTANCES: Dict[Tuple[TypeID, int], "Bucket"] = {}
 
-    BUCKET_TYPE = {TypeID.DATE: lambda n: BucketInteger(n),
-                   TypeID.INTEGER: lambda n: BucketInteger(n),
-                   TypeID.TIME: lambda n: BucketLong(n),
-                   TypeID.TIMESTAMP: lambda n: BucketLong(n),
-                   TypeID.LONG: lambda n: BucketLong(n),
-                   TypeID.DECIMAL: lambda n: BucketDecimal(n),
-                   TypeID.STRING: lambda n: BucketString(n),
-                   TypeID.FIXED: lambda n: BucketByteBuffer(n),
-                   TypeID.BINARY: lambda n: BucketByteBuffer(n),
-                   TypeID.UUID: lambda n: BucketUUID(n)}
+    # filled in with the bucket classes once they are defined, see the end of this module
+    BUCKET_TYPE: Dict[TypeID, type] = {}
 
     @staticmethod
     def get(type_var, n):
-        bucket_type_func = Bucket.BUCKET_TYPE.get(type_var.type_id)
-        if not bucket_type_func:
-            raise RuntimeError("Cannot bucket by type: %s" % type_var)
-        return bucket_type_func(n)
+        # bucket transforms are immutable, so one instance is shared per source type and width
+        key = (type_var.type_id, n)
+        bucket = Bucket.INSTANCES.get(key)
+        if bucket is None:
+            bucket_type = Bucket.BUCKET_TYPE.get(type_var.type_id)
+            if not bucket_type:
+                raise RuntimeError("Cannot bucket by type: %s" % type_var)
+            bucket = Bucket.INSTANCES.setdefault(key, bucket_type(n))
+        return bucket
+
+    @staticmethod
+    def apply_func(bucket_type, n):
+        key = (bucket_type, n)
+        apply_func = Bucket.APPLY_FUNCS.get(key)
+        if apply_func is None:
+            apply_func = Bucket.APPLY_FUNCS[key] = bucket_type.specialize(n)
+        return apply_func
+
+    @classmethod
+    def specialize(cls, n):
+        hash_func = cls.hash
+        if is_power_of_two(n):
+            mask = n - 1
+
+            def apply(value):
+                return None if value is None else hash_func(value) & mask
+        else:
+            max_int = JAVA_MAX_INT
+
+            def apply(value):
+                return None if value is None else (hash_func(value) & max_int) % n
+
+        return apply
 
     def __init__(self, n):
         self.n = n
+        # apply is specialized once per (bucket type, n) and shared by all instances
+        self.apply = Bucket.apply_func(type(self), n)
 
-    def __eq__(self, other):
-        if id(self) == id(other):
-            return True
-        if other is None or not isinstance(other, Bucket):
-            return False
+    def __reduce__(self):
+        return type(self), (self.n,)
 
-        return self.n == other.n
+    def __eq__(self, other):
+        # like Java, buckets of any source type compare equal when their widths match
+        return self is other or (isinstance(other, Bucket) and self.n == other.n)
 
     def __hash__(self):
-        return hash(self.__key())
-
-    def __key(self):
-        return Bucket.__class__, self.n
+        return hash(("bucket", self.n))
 
     def __repr__(self):
         return "Bucket[%s]" % self.n
@@ -75,10 +107,24 @@ class Bucket(Transform):
     def __str__(self):
         return "bucket[%s]" % self.n
 
-    def apply(self, value):
-        return (self.hash(value) & JAVA_MAX_INT) % self.n
+    def apply_array(self, values, out=None):
+        if out is None:
+            return np.fromiter((self.apply(value) for value in values), dtype=np.int32, count=len(values))
+
+        out[:] = [self.apply(value) for value in values]
+        return out
 
-    def hash(self):
+    def apply_batch(self, values):
+        return pa.array([self.apply(value) for value in values.to_pylist()], type=pa.int32())
+
+    def partition_indices(self, values):
+        # bucket of every row together with the row count of every bucket, so that a writer can size
+        # its per-partition buffers and scatter rows without a second pass over the ids
+        row_to_partition = self.apply_array(values)
+        return row_to_partition, np.bincount(row_to_partition, minlength=self.n)
+
+    @staticmethod
+    def hash(value):
         raise NotImplementedError()
 
     def project(self, name, predicate):
@@ -95,22 +141,38 @@ class Bucket(Transform):
 
 class BucketInteger(Bucket):
 
-    def __init__(self, n):
-        super(BucketInteger, self).__init__(n)
+    @staticmethod
+    def hash(value):
+        return Bucket.MURMUR3.hash(LONG_STRUCT.pack(value))
+
+    @classmethod
+    def specialize(cls, n):
+        return specialize_packed(LONG_STRUCT.pack, n)
+
+    def apply_array(self, values, out=None):
+        return bucket_long_array(values, self.n, out)
 
-    def hash(self, value):
-        return Bucket.MURMUR3.hash(struct.pack("q", value))
+    def apply_batch(self, values):
+        return TransformUtil.apply_masked(TransformUtil.to_iceberg_units(values).cast(pa.int32()), self.apply_array, 0, result_type=pa.int32())
 
     def can_transform(self, type_var):
         return type_var.type_id in [TypeID.INTEGER, TypeID.DATE]
 
 
 class BucketLong(Bucket):
-    def __init__(self, n):
-        super(BucketLong, self).__init__(n)
+    @staticmethod
+    def hash(value):
+        return Bucket.MURMUR3.hash(LONG_STRUCT.pack(value))
+
+    @classmethod
+    def specialize(cls, n):
+        return specialize_packed(LONG_STRUCT.pack, n)
 
-    def hash(self, value):
-        return Bucket.MURMUR3.hash(struct.pack("q", value))
+    def apply_array(self, values, out=None):
+        return bucket_long_array(values, self.n, out)
+
+    def apply_batch(self, values):
+        return TransformUtil.apply_masked(TransformUtil.to_iceberg_units(values).cast(pa.int64()), self.apply_array, 0, result_type=pa.int32())
 
     def can_transform(self, type_var):
         return type_var.type_id in [TypeID.LONG,
@@ -119,22 +181,26 @@ class BucketLong(Bucket):
 
 
 class BucketFloat(Bucket):
-    def __init__(self, n):
-        super(BucketFloat, self).__init__(n)
+    @staticmethod
+    def hash(value):
+        return Bucket.MURMUR3.hash(DOUBLE_STRUCT.pack(value))
 
-    def hash(self, value):
-        return Bucket.MURMUR3.hash(struct.pack("d", value))
+    @classmethod
+    def specialize(cls, n):
+        return specialize_packed(DOUBLE_STRUCT.pack, n)
 
     def can_transform(self, type_var):
         return type_var.type_id == TypeID.FLOAT
 
 
 class BucketDouble(Bucket):
-    def __init__(self, n):
-        super(BucketDouble, self).__init__(n)
+    @staticmethod
+    def hash(value):
+        return Bucket.MURMUR3.hash(DOUBLE_STRUCT.pack(value))
 
-    def hash(self, value):
-        return Bucket.MURMUR3.hash(struct.pack("d", value))
+    @classmethod
+    def specialize(cls, n):
+        return specialize_packed(DOUBLE_STRUCT.pack, n)
 
     def can_transform(self, type_var):
         return type_var.type_id == TypeID.DOUBLE
@@ -142,10 +208,8 @@ class BucketDouble(Bucket):
 
 class BucketDecimal(Bucket):
 
-    def __init__(self, n):
-        super(BucketDecimal, self).__init__(n)
-
-    def hash(self, value):
+    @staticmethod
+    def hash(value):
         # to-do: unwrap to_bytes func since python2 support is being removed
         unscaled_value = TransformUtil.unscale_decimal(value)
         number_of_bytes = int(math.ceil(unscaled_value.bit_length() / 8))
@@ -156,10 +220,8 @@ class BucketDecimal(Bucket):
 
 
 class BucketString(Bucket):
-    def __init__(self, n):
-        super(BucketString, self).__init__(n)
-
-    def hash(self, value):
+    @staticmethod
+    def hash(value):
         return Bucket.MURMUR3.hash(value)
 
     def can_transform(self, type_var):
@@ -167,10 +229,8 @@ class BucketString(Bucket):
 
 
 class BucketByteBuffer(Bucket):
-    def __init__(self, n):
-        super(BucketByteBuffer, self).__init__(n)
-
-    def hash(self, value):
+    @staticmethod
+    def hash(value):
         return Bucket.MURMUR3.hash(value)
 
     def can_transform(self, type_var):
@@ -178,16 +238,84 @@ class BucketByteBuffer(Bucket):
 
 
 class BucketUUID(Bucket):
-    def __init__(self, n):
-        super(BucketUUID, self).__init__(n)
+    @staticmethod
+    def hash(value):
+        return Bucket.MURMUR3.hash(UUID_BYTES(value))
+
+    @classmethod
+    def specialize(cls, n):
+        return specialize_packed(UUID_BYTES, n)
+
+    def apply_array(self, values, out=None):
+        # values holds the (most significant, least significant) 64-bit halves of each UUID, which are
+        # hashed as their 16 byte big-endian representation
+        blocks = np.ascontiguousarray(values, dtype=">u8").view("<u4").reshape(-1, 4)
+        return bucket_hashes(Murmur3Util.hash_blocks(blocks, out), self.n)
+
+    def apply_batch(self, values):
+        # arrow stores UUIDs as fixed_size_binary(16), so the data buffer can be hashed in place
+        if not (pa.types.is_fixed_size_binary(values.type) and values.type.byte_width == 16):
+            raise RuntimeError("Cannot bucket arrow type %s as UUID, expected fixed_size_binary[16]" % values.type)
+
+        if values.null_count == len(values):
+            return pa.nulls(len(values), type=pa.int32())
 
-    def hash(self, value):
-        return Bucket.MURMUR3.hash(Conversions.to_byte_buffer(TypeID.UUID, value))
+        data = np.frombuffer(values.buffers()[1], dtype=np.uint8)[values.offset * 16:(values.offset + len(values)) * 16]
+        mask = values.is_null().to_numpy(zero_copy_only=False) if values.null_count else None
+        hashes = Murmur3Util.hash_blocks(data.view("<u4").reshape(-1, 4))
+        return pa.array(bucket_hashes(hashes, self.n), mask=mask, type=pa.int32())
 
     def can_transform(self, type_var):
         return type_var.type_id == TypeID.UUID
 
 
+Bucket.BUCKET_TYPE.update({TypeID.DATE: BucketInteger,
+                           TypeID.INTEGER: BucketInteger,
+                           TypeID.TIME: BucketLong,
+                           TypeID.TIMESTAMP: BucketLong,
+                           TypeID.LONG: BucketLong,
+                           TypeID.DECIMAL: BucketDecimal,
+                           TypeID.STRING: BucketString,
+                           TypeID.FIXED: BucketByteBuffer,
+                           TypeID.BINARY: BucketByteBuffer,
+                           TypeID.UUID: BucketUUID})
+
+
+def is_power_of_two(n):
+    # (h & JAVA_MAX_INT) % n == h & (n - 1) when n is a power of two, which replaces the division with a mask
+    return n > 0 and n & (n - 1) == 0
+
+
+def specialize_packed(pack, n):
+    # inlines a precompiled struct pack and the hash into a single frame with every constant bound locally
+    murmur3 = Bucket.MURMUR3.hash
+    if is_power_of_two(n):
+        mask = n - 1
+
+        def apply(value):
+            return None if value is None else murmur3(pack(value)) & mask
+    else:
+        max_int = JAVA_MAX_INT
+
+        def apply(value):
+            return None if value is None else (murmur3(pack(value)) & max_int) % n
+
+    return apply
+
+
+def bucket_long_array(values, n, out=None):
+    return bucket_hashes(Murmur3Util.hash_long_array(values, out), n)
+
+
+def bucket_hashes(hashes, n):
+    if is_power_of_two(n):
+        hashes &= np.int32(n - 1)
+    else:
+        hashes &= JAVA_MAX_INT
+        hashes %= np.int32(n)
+    return hashes
+
+
 def to_bytes(n, length, byteorder='big'):
     if sys.version_info >= (3, 0):
         return n.to_bytes(length, byteorder=byteorder)
@@ -17,6 +17,8 @@
 
 import datetime
 
+import pyarrow as pa
+
 from .projection_util import ProjectionUtil
 from .transform import Transform
 from .transform_util import TransformUtil
@@ -34,9 +36,9 @@ class Dates(Transform):
     EPOCH = datetime.datetime.utcfromtimestamp(0)
     SECONDS_IN_DAY = 86400
 
-    HUMAN_FUNCS = {"year": lambda x: TransformUtil.human_year(x),
-                   "month": lambda x: TransformUtil.human_month(x),
-                   "day": lambda x: TransformUtil.human_day(x)}
+    HUMAN_FUNCS = {"year": TransformUtil.human_year,
+                   "month": TransformUtil.human_month,
+                   "day": TransformUtil.human_day}
 
     def __init__(self, granularity, name):
         if granularity not in (Dates.YEAR, Dates.MONTH, Dates.DAY):
@@ -45,12 +47,20 @@ class Dates(Transform):
         self.name = name
 
     def apply(self, days):
+        if days is None:
+            return None
+
         if self.granularity == Dates.DAY:
             return days
         else:
             apply_func = getattr(TransformUtil, "diff_{}".format(self.granularity))
             return apply_func(datetime.datetime.utcfromtimestamp(days * Dates.SECONDS_IN_DAY), Dates.EPOCH)
 
+    def apply_batch(self, values):
+        # apply works on the stored days, so arrow temporal values are converted to them first
+        storage = TransformUtil.to_iceberg_units(values).cast(pa.int32())
+        return pa.array([self.apply(value) for value in storage.to_pylist()], type=pa.int32())
+
     def can_transform(self, type):
         return type.type_id == TypeID.DATE
 
@@ -79,9 +89,8 @@ class Dates(Transform):
         return "time"
 
     def __eq__(self, other):
-        if id(self) == id(other):
-            return True
-        if other is None or not isinstance(other, Dates):
-            return False
+        return self is other or (type(self) is type(other)
+                                 and self.granularity == other.granularity and self.name == other.name)
 
-        return self.granularity == other.granularity and self.name == other.name
+    def __hash__(self):
+        return hash((type(self), self.granularity, self.name))
@@ -15,24 +15,49 @@
 # specific language governing permissions and limitations
 # under the License.
 
+from typing import Dict
+
 from .transform import Transform
 from .transform_util import TransformUtil
 from ..expressions import Expressions
-from ..types import TypeID
+from ..types import (Type,
+                     TypeID)
 
 
 class Identity(Transform):
+    HUMAN_FUNCS = {TypeID.DATE: TransformUtil.human_day,
+                   TypeID.TIME: TransformUtil.human_time,
+                   TypeID.BINARY: TransformUtil.base_64_encode,
+                   TypeID.FIXED: TransformUtil.base_64_encode}
+    INSTANCES: Dict[Type, "Identity"] = {}
 
     @staticmethod
     def get(type_var):
-        return Identity(type_var)
+        # identity transforms are immutable, so one instance is shared per source type
+        identity = Identity.INSTANCES.get(type_var)
+        if identity is None:
+            identity = Identity.INSTANCES.setdefault(type_var, Identity(type_var))
+        return identity
+
+    @staticmethod
+    def human_func_for(type_var):
+        if type_var.type_id == TypeID.TIMESTAMP:
+            if type_var.adjust_to_utc:
+                return TransformUtil.human_timestamp_with_timezone
+            return TransformUtil.human_timestamp_without_timezone
+
+        return Identity.HUMAN_FUNCS.get(type_var.type_id, str)
 
     def __init__(self, type_var):
         self.type_var = type_var
+        self.human_func = Identity.human_func_for(type_var)
 
     def apply(self, value):
         return value
 
+    def apply_batch(self, values):
+        return values
+
     def can_transform(self, type_var):
         return type_var.is_primitive_type()
 
@@ -52,40 +77,13 @@ class Identity(Transform):
         if value is None:
             return "null"
 
-        if self.type_var.type_id == TypeID.DATE:
-            return TransformUtil.human_day(value)
-        elif self.type_var.type_id == TypeID.TIME:
-            return TransformUtil.human_time(value)
-        elif self.type_var.type_id == TypeID.TIMESTAMP:
-            if self.type_var.adjust_to_utc:
-                return TransformUtil.human_timestamp_with_timezone(value)
-            else:
-                return TransformUtil.human_timestamp_without_timezone(value)
-        elif self.type_var.type_id in (TypeID.BINARY, TypeID.FIXED):
-            raise NotImplementedError()
-            # if isinstance(value, bytearray):
-            #     return base64.b64encode(value)
-            # elif isinstance(value, bytes):
-            #     return base64.b64encode(bytes(value))
-            # else:
-            #     raise RuntimeError("Unsupported binary type: %s" % value.__class__.__name__)
-        else:
-            return str(value)
+        return self.human_func(value)
 
     def __str__(self):
         return "identity"
 
     def __eq__(self, other):
-        if id(self) == id(other):
-            return True
-
-        if other is None or not isinstance(other, Identity):
-            return False
-
-        return self.type_var == other.type_var
+        return self is other or (type(self) is type(other) and self.type_var == other.type_var)
 
     def __hash__(self):
-        return hash(self.__key())
-
-    def __key(self):
-        return Identity.__class__, self.type_var
+        return hash((type(self), self.type_var))
@@ -0,0 +1,93 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import numpy as np
+
+
+class Murmur3Util(object):
+    """
+    Vectorized MurmurHash3 x86_32 (seed 0) over numpy arrays.
+
+    Produces the same signed 32-bit hashes as mmh3.hash, so it can be used in
+    place of per-value hashing when bucketing whole columns. All mixing is done
+    in place on the output buffer and two chunk-sized scratch buffers, so
+    hashing a column allocates no temporaries proportional to its length.
+    """
+    C1 = np.uint32(0xcc9e2d51)
+    C2 = np.uint32(0x1b873593)
+    M = np.uint32(5)
+    N = np.uint32(0xe6546b64)
+    F1 = np.uint32(0x85ebca6b)
+    F2 = np.uint32(0xc2b2ae35)
+    CHUNK_SIZE = 65536
+
+    @staticmethod
+    def hash_long_array(values, out=None):
+        # each value is hashed as its 8-byte little-endian representation, i.e. two 4-byte blocks
+        blocks = np.ascontiguousarray(values, dtype="<i8").view("<u4").reshape(-1, 2)
+        return Murmur3Util.hash_blocks(blocks, out)
+
+    @staticmethod
+    def hash_blocks(blocks, out=None):
+        num_values, num_blocks = blocks.shape
+        if out is None:
+            out = np.empty(num_values, dtype=np.int32)
+
+        # hash in chunks so that every mixing pass works on L2 resident buffers (~1MB of state per chunk)
+        chunk_size = max(1, min(num_values, Murmur3Util.CHUNK_SIZE))
+        k1 = np.empty(chunk_size, dtype=np.uint32)
+        tmp = np.empty(chunk_size, dtype=np.uint32)
+        h1_all = out.view(np.uint32)
+        for start in range(0, num_values, chunk_size):
+            end = min(start + chunk_size, num_values)
+            size = end - start
+            Murmur3Util.hash_chunk(blocks[start:end], h1_all[start:end], k1[:size], tmp[:size])
+
+        return out
+
+    @staticmethod
+    def hash_chunk(blocks, h1, k1, tmp):
+        h1.fill(0)
+        for i in range(blocks.shape[1]):
+            np.multiply(blocks[:, i], Murmur3Util.C1, out=k1)
+            Murmur3Util.rotl(k1, 15, tmp)
+            k1 *= Murmur3Util.C2
+
+            h1 ^= k1
+            Murmur3Util.rotl(h1, 13, tmp)
+            h1 *= Murmur3Util.M
+            h1 += Murmur3Util.N
+
+        h1 ^= np.uint32(blocks.shape[1] * 4)
+        Murmur3Util.fmix(h1, tmp)
+
+    @staticmethod
+    def rotl(x, r, tmp):
+        np.right_shift(x, np.uint32(32 - r), out=tmp)
+        x <<= np.uint32(r)
+        x |= tmp
+
+    @staticmethod
+    def fmix(h1, tmp):
+        np.right_shift(h1, np.uint32(16), out=tmp)
+        h1 ^= tmp
+        h1 *= Murmur3Util.F1
+        np.right_shift(h1, np.uint32(13), out=tmp)
+        h1 ^= tmp
+        h1 *= Murmur3Util.F2
+        np.right_shift(h1, np.uint32(16), out=tmp)
+        h1 ^= tmp
@@ -18,6 +18,8 @@
 
 import datetime
 
+import pyarrow as pa
+
 from .transform import Transform
 from .transform_util import TransformUtil
 from ..expressions import (Expressions,
@@ -33,10 +35,10 @@ class Timestamps(Transform):
     HOUR = "hour"
 
     EPOCH = datetime.datetime.utcfromtimestamp(0)
-    HUMAN_FUNCS = {"year": lambda x: TransformUtil.human_year(x),
-                   "month": lambda x: TransformUtil.human_month(x),
-                   "day": lambda x: TransformUtil.human_day(x),
-                   "hour": lambda x: TransformUtil.human_hour(x)}
+    HUMAN_FUNCS = {"year": TransformUtil.human_year,
+                   "month": TransformUtil.human_month,
+                   "day": TransformUtil.human_day,
+                   "hour": TransformUtil.human_hour}
 
     def __init__(self, granularity, name):
         if granularity not in (Timestamps.YEAR, Timestamps.MONTH, Timestamps.DAY, Timestamps.HOUR):
@@ -46,9 +48,17 @@ class Timestamps(Transform):
         self.name = name
 
     def apply(self, value):
+        if value is None:
+            return None
+
         apply_func = getattr(TransformUtil, "diff_{}".format(self.granularity))
         return apply_func(datetime.datetime.utcfromtimestamp(value / 1000000), Timestamps.EPOCH)
 
+    def apply_batch(self, values):
+        # apply works on the stored micros, so arrow temporal values are converted to them first
+        storage = TransformUtil.to_iceberg_units(values).cast(pa.int64())
+        return pa.array([self.apply(value) for value in storage.to_pylist()], type=pa.int32())
+
     def can_transform(self, type_var):
         return type_var.type_id == TypeID.TIMESTAMP
 
@@ -75,9 +85,8 @@ class Timestamps(Transform):
         return "time"
 
     def __eq__(self, other):
-        if id(self) == id(other):
-            return True
-        if other is None or not isinstance(other, Timestamps):
-            return False
+        return self is other or (type(self) is type(other)
+                                 and self.granularity == other.granularity and self.name == other.name)
 
-        return self.granularity == other.granularity and self.name == other.name
+    def __hash__(self):
+        return hash((type(self), self.granularity, self.name))
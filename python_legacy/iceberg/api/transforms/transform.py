@@ -15,6 +15,8 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import pyarrow as pa
+
 
 class Transform(object):
 
@@ -24,6 +26,9 @@ class Transform(object):
     def apply(self, value):
         raise NotImplementedError()
 
+    def apply_batch(self, values):
+        return pa.array([self.apply(value) for value in values.to_pylist()])
+
     def can_transform(self, type_var):
         raise NotImplementedError()
 
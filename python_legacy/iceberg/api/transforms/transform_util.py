@@ -17,6 +17,7 @@
 
 from datetime import datetime, timedelta
 
+import pyarrow as pa
 import pytz
 
 
@@ -78,6 +79,25 @@ class TransformUtil(object):
         return (date1.year - date2.year) - \
                (1 if date1.month < date2.month or (date1.month == date2.month and date1.day < date2.day) else 0)
 
+    @staticmethod
+    def to_iceberg_units(values):
+        # iceberg stores dates as days and times and timestamps as micros, so arrow temporal arrays of any
+        # other unit are converted before their raw integer values are read
+        if pa.types.is_date64(values.type):
+            return values.cast(pa.date32())
+        if pa.types.is_timestamp(values.type) and values.type.unit != "us":
+            return values.cast(pa.timestamp("us", tz=values.type.tz))
+        if pa.types.is_time(values.type) and values.type != pa.time64("us"):
+            return values.cast(pa.time64("us"))
+        return values
+
+    @staticmethod
+    def apply_masked(values, array_func, fill_value, result_type=None):
+        # runs a numpy kernel over the non-null slots of an arrow array and carries the nulls through to the result
+        mask = values.is_null().to_numpy(zero_copy_only=False) if values.null_count else None
+        result = array_func(values.fill_null(fill_value).to_numpy(zero_copy_only=False))
+        return pa.array(result, mask=mask, type=result_type)
+
     @staticmethod
     def unscale_decimal(decimal_value):
         value_tuple = decimal_value.as_tuple()
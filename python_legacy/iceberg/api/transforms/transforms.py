@@ -39,12 +39,22 @@ from ..types import (TypeID)
 
 class Transforms(object):
     HAS_WIDTH = re.compile("(\\w+)\\[(\\d+)\\]")
+    WIDTH_FUNCS = {"bucket": Bucket.get,
+                   "truncate": Truncate.get}
 
     def __init__(self):
         pass
 
     @staticmethod
     def from_string(type_var, transform):
+        lower_transform = transform.lower()
+        # fast path for the canonical "bucket[N]" / "truncate[W]" forms, without going through the regex
+        if lower_transform.endswith("]"):
+            name, _, width = lower_transform[:-1].partition("[")
+            width_func = Transforms.WIDTH_FUNCS.get(name)
+            if width_func is not None and width.isdecimal():
+                return width_func(type_var, int(width))
+
         match = Transforms.HAS_WIDTH.match(transform)
 
         if match is not None:
@@ -55,14 +65,14 @@ class Transforms(object):
             elif name.lower() == "bucket":
                 return Bucket.get(type_var, w)
 
-        if transform.lower() == "identity":
+        if lower_transform == "identity":
             return Identity.get(type_var)
         elif type_var.type_id == TypeID.TIMESTAMP:
-            return Timestamps(transform.lower(), transform.lower())
+            return Timestamps(lower_transform, lower_transform)
         elif type_var.type_id == TypeID.DATE:
-            return Dates(transform.lower(), transform.lower())
+            return Dates(lower_transform, lower_transform)
 
-        if transform.lower() == "void":
+        if lower_transform == "void":
             return VoidTransform.get()
 
         return UnknownTransform(type_var, transform)
@@ -16,6 +16,11 @@
 # under the License.
 
 from decimal import Decimal
+import operator
+from typing import Dict, Tuple
+
+import numpy as np
+import pyarrow as pa
 
 from .projection_util import ProjectionUtil
 from .transform import Transform
@@ -26,9 +31,21 @@ from ..types import TypeID
 
 
 class Truncate(Transform):
+    INSTANCES: Dict[Tuple[TypeID, int], "Truncate"] = {}
 
     @staticmethod
     def get(type_var, width):
+        # truncate transforms are immutable, so one instance is shared per source type and width
+        key = (type_var.type_id, width)
+        truncate = Truncate.INSTANCES.get(key)
+        if truncate is None:
+            truncate = Truncate.create(type_var, width)
+            if truncate is not None:
+                truncate = Truncate.INSTANCES.setdefault(key, truncate)
+        return truncate
+
+    @staticmethod
+    def create(type_var, width):
         if type_var.type_id == TypeID.INTEGER:
             return TruncateInteger(width)
         elif type_var.type_id == TypeID.LONG:
@@ -37,6 +54,8 @@ class Truncate(Transform):
             return TruncateDecimal(width)
         elif type_var.type_id == TypeID.STRING:
             return TruncateString(width)
+        elif type_var.type_id == TypeID.BINARY:
+            return TruncateByteBuffer(width)
 
     def __init__(self):
         raise NotImplementedError()
@@ -44,6 +63,12 @@ class Truncate(Transform):
     def apply(self, value):
         raise NotImplementedError()
 
+    def apply_array(self, values):
+        return np.frompyfunc(self.apply, 1, 1)(values)
+
+    def apply_batch(self, values):
+        return pa.array([self.apply(value) for value in values.to_pylist()], type=values.type)
+
     def can_transform(self, type_var):
         raise NotImplementedError()
 
@@ -63,8 +88,19 @@ class TruncateInteger(Truncate):
         self.W = width
 
     def apply(self, value):
+        if value is None:
+            return None
+
         return value - (((value % self.W) + self.W) % self.W)
 
+    def apply_array(self, values):
+        # np.mod takes the sign of the divisor, matching the floor semantics of apply
+        values = np.asarray(values)
+        return values - np.mod(values, values.dtype.type(self.W))
+
+    def apply_batch(self, values):
+        return TransformUtil.apply_masked(values, self.apply_array, 0, result_type=values.type)
+
     def can_transform(self, type_var):
         return type_var.type_id == TypeID.INTEGER
 
@@ -95,19 +131,10 @@ class TruncateInteger(Truncate):
                 return Expressions.predicate(Operation.LT, name, in_image)
 
     def __eq__(self, other):
-        if id(self) == id(other):
-            return True
-
-        if other is None or not isinstance(other, TruncateInteger):
-            return False
-
-        return self.W == other.W
+        return self is other or (type(self) is type(other) and self.W == other.W)
 
     def __hash__(self):
-        return hash(self.__key())
-
-    def __key(self):
-        return TruncateInteger.__class__, self.W
+        return hash((type(self), self.W))
 
     def __str__(self):
         return "truncate[%s]" % self.W
@@ -119,8 +146,19 @@ class TruncateLong(Truncate):
         self.W = width
 
     def apply(self, value):
+        if value is None:
+            return None
+
         return value - (((value % self.W) + self.W) % self.W)
 
+    def apply_array(self, values):
+        # np.mod takes the sign of the divisor, matching the floor semantics of apply
+        values = np.asarray(values)
+        return values - np.mod(values, values.dtype.type(self.W))
+
+    def apply_batch(self, values):
+        return TransformUtil.apply_masked(values, self.apply_array, 0, result_type=values.type)
+
     def can_transform(self, type_var):
         return type_var.type_id == TypeID.LONG
 
@@ -134,19 +172,10 @@ class TruncateLong(Truncate):
         return None
 
     def __eq__(self, other):
-        if id(self) == id(other):
-            return True
-
-        if other is None or not isinstance(other, TruncateLong):
-            return False
-
-        return self.W == other.W
+        return self is other or (type(self) is type(other) and self.W == other.W)
 
     def __hash__(self):
-        return hash(self.__key())
-
-    def __key(self):
-        return TruncateLong.__class__, self.W
+        return hash((type(self), self.W))
 
     def __str__(self):
         return "truncate[%s]" % self.W
@@ -158,6 +187,9 @@ class TruncateDecimal(Truncate):
         self.unscaled_width = unscaled_width
 
     def apply(self, value):
+        if value is None:
+            return None
+
         unscaled_value = TransformUtil.unscale_decimal(value)
         applied_value = unscaled_value - (((unscaled_value % self.unscaled_width) + self.unscaled_width) % self.unscaled_width)
         return Decimal("{}e{}".format(applied_value, value.as_tuple().exponent))
@@ -175,19 +207,10 @@ class TruncateDecimal(Truncate):
         return None
 
     def __eq__(self, other):
-        if id(self) == id(other):
-            return True
-
-        if other is None or not isinstance(other, TruncateDecimal):
-            return False
-
-        return self.unscaled_width == other.unscaled_width
+        return self is other or (type(self) is type(other) and self.unscaled_width == other.unscaled_width)
 
     def __hash__(self):
-        return hash(self.__key())
-
-    def __key(self):
-        return TruncateDecimal.__class__, self.unscaled_width
+        return hash((type(self), self.unscaled_width))
 
     def __str__(self):
         return "truncate[%s]" % self.unscaled_width
@@ -198,7 +221,19 @@ class TruncateString(Truncate):
         self.L = length
 
     def apply(self, value):
-        return value[0:min(self.L, len(value))]
+        if value is None:
+            return None
+
+        # str slicing counts code points and clamps to the string length
+        return value[:self.L]
+
+    def apply_array(self, values):
+        # sliced per value rather than cast to a fixed-width unicode dtype, which would allocate 4 * L bytes
+        # per row and strip trailing "\x00" code points
+        return np.frompyfunc(operator.itemgetter(slice(None, self.L)), 1, 1)(np.asarray(values, dtype=object))
+
+    def apply_batch(self, values):
+        return TransformUtil.apply_masked(values, self.apply_array, "", result_type=values.type)
 
     def can_transform(self, type_var):
         return type_var.type_id == TypeID.STRING
@@ -213,19 +248,49 @@ class TruncateString(Truncate):
         return None
 
     def __eq__(self, other):
-        if id(self) == id(other):
-            return True
+        return self is other or (type(self) is type(other) and self.L == other.L)
+
+    def __hash__(self):
+        return hash((type(self), self.L))
 
-        if other is None or not isinstance(other, TruncateString):
-            return False
+    def __str__(self):
+        return "truncate[%s]" % self.L
 
-        return self.L == other.L
 
-    def __hash__(self):
-        return hash(self.__key())
+class TruncateByteBuffer(Truncate):
+    def __init__(self, length):
+        self.L = length
+
+    def apply(self, value):
+        if value is None:
+            return None
+
+        return value[:self.L]
+
+    def apply_view(self, value):
+        # zero-copy alternative to apply for callers that only read or compare the truncated prefix
+        if value is None:
+            return None
+
+        return memoryview(value)[:self.L]
+
+    def can_transform(self, type_var):
+        return type_var.type_id == TypeID.BINARY
 
-    def __key(self):
-        return TruncateString.__class__, self.L
+    def project(self, name, predicate):
+        if predicate.op == Operation.NOT_NULL or predicate.op == Operation.IS_NULL:
+            return Expressions.predicate(predicate.op, name)
+
+        return ProjectionUtil.truncate_array(name, predicate, self)
+
+    def project_strict(self, name, predicate):
+        return None
+
+    def __eq__(self, other):
+        return self is other or (type(self) is type(other) and self.L == other.L)
+
+    def __hash__(self):
+        return hash((type(self), self.L))
 
     def __str__(self):
         return "truncate[%s]" % self.L
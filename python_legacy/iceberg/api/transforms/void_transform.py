@@ -15,6 +15,8 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import pyarrow as pa
+
 from .transform import Transform
 
 
@@ -33,6 +35,9 @@ class VoidTransform(Transform):
     def apply(self, value):
         return None
 
+    def apply_batch(self, values):
+        return pa.nulls(len(values), type=values.type)
+
     def can_transform(self, type_var):
         return True
 
@@ -87,6 +87,9 @@ class PrimitiveType(Type):
     def __eq__(self, other):
         return type(self) == type(other)
 
+    def __hash__(self):
+        return hash(type(self))
+
     def __ne__(self, other):
         return not self.__eq__(other)
 
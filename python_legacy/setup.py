@@ -35,6 +35,7 @@ setup(
                       'pytz',
                       'requests',
                       'retrying',
+                      'numpy',
                       'pandas',
                       'pyarrow>=3.0.0,<=4.0.1'
                       ],
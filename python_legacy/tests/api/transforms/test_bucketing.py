@@ -16,6 +16,7 @@
 # under the License.
 
 from decimal import Decimal, getcontext
+import uuid
 
 from iceberg.api.expressions import Literal
 from iceberg.api.transforms import (Bucket,
@@ -26,7 +27,10 @@ from iceberg.api.types import (DateType,
                                IntegerType,
                                LongType,
                                TimestampType,
-                               TimeType)
+                               TimeType,
+                               UUIDType)
+import numpy as np
+import pyarrow as pa
 import pytest
 
 
@@ -62,3 +66,143 @@ def test_spec_values_dec(test_input, test_type, scale_factor, expected):
      TimestampType.with_timezone(), -2047944441)])
 def test_spec_values_datetime_uuid(test_input, test_type, expected):
     assert Bucket.get(test_type, 100).hash(test_input.value) == expected
+
+
+@pytest.mark.parametrize("test_type", [IntegerType.get(), LongType.get(), DateType.get(), TimeType.get()])
+def test_apply_array_matches_apply(test_type):
+    values = np.array([0, 1, -1, 34, 17486, 81068000000, 1510871468000000,
+                       np.iinfo(np.int64).min, np.iinfo(np.int64).max], dtype=np.int64)
+    bucket = Bucket.get(test_type, 100)
+    assert bucket.apply_array(values).tolist() == [bucket.apply(value) for value in values.tolist()]
+
+
+def test_apply_shared_between_instances():
+    assert Bucket.get(LongType.get(), 16).apply is Bucket.get(LongType.get(), 16).apply
+    assert Bucket.get(LongType.get(), 16).apply is not Bucket.get(LongType.get(), 32).apply
+
+
+def test_apply_array_into_out():
+    values = np.arange(-1000, 1000, dtype=np.int64)
+    out = np.empty(len(values), dtype=np.int32)
+    bucket = Bucket.get(LongType.get(), 16)
+    assert bucket.apply_array(values, out) is out
+    assert out.tolist() == [bucket.apply(value) for value in values.tolist()]
+
+
+def test_apply_array_across_chunks():
+    values = np.arange(-500000, 500000, 7, dtype=np.int64)
+    bucket = Bucket.get(LongType.get(), 100)
+    assert bucket.apply_array(values).tolist() == [bucket.apply(value) for value in values.tolist()]
+
+
+@pytest.mark.parametrize("num_buckets", [1, 2, 16, 128, 1024])
+def test_power_of_two_buckets(num_buckets):
+    values = [0, 1, -1, 34, 1510871468000000, -2 ** 63, 2 ** 63 - 1]
+    bucket = Bucket.get(LongType.get(), num_buckets)
+    expected = [(bucket.hash(value) & 2147483647) % num_buckets for value in values]
+    assert [bucket.apply(value) for value in values] == expected
+    assert bucket.apply_array(np.array(values, dtype=np.int64)).tolist() == expected
+
+
+@pytest.mark.parametrize("bucket", [BucketFloat(100), BucketDouble(100), BucketFloat(16), BucketDouble(16)])
+def test_apply_float_matches_hash(bucket):
+    for value in [0.0, 1.0, -1.5, 3.14159]:
+        assert bucket.apply(value) == (bucket.hash(value) & 2147483647) % bucket.n
+
+
+@pytest.mark.parametrize("test_type", [IntegerType.get(), LongType.get(), DecimalType.of(9, 2), TimestampType.without_timezone()])
+@pytest.mark.parametrize("num_buckets", [16, 100])
+def test_apply_null(test_type, num_buckets):
+    assert Bucket.get(test_type, num_buckets).apply(None) is None
+
+
+def test_apply_zero_is_not_null():
+    assert Bucket.get(IntegerType.get(), 100).apply(0) == (Bucket.get(IntegerType.get(), 100).hash(0) & 2147483647) % 100
+
+
+@pytest.mark.parametrize("test_type,arrow_type,values", [
+    (IntegerType.get(), pa.int32(), [34, None, 0, -1]),
+    (LongType.get(), pa.int64(), [34, None, 0, -1]),
+    (DateType.get(), pa.date32(), [17486, None, 0]),
+    (TimestampType.without_timezone(), pa.timestamp("us"), [1510871468000000, None]),
+    (DecimalType.of(9, 2), pa.decimal128(9, 2), [Decimal("14.20"), None])])
+def test_apply_batch(test_type, arrow_type, values):
+    bucket = Bucket.get(test_type, 100)
+    result = bucket.apply_batch(pa.array(values, type=arrow_type))
+    assert result.type == pa.int32()
+    assert result.to_pylist() == [bucket.apply(value) for value in values]
+
+
+@pytest.mark.parametrize("test_type,arrow_type,values,iceberg_values", [
+    (DateType.get(), pa.date64(), [17486 * 86400000, None], [17486, None]),
+    (TimestampType.without_timezone(), pa.timestamp("ns"), [1510871468000000000, None], [1510871468000000, None]),
+    (TimestampType.with_timezone(), pa.timestamp("ms", tz="UTC"), [1510871468000, None], [1510871468000000, None]),
+    (TimeType.get(), pa.time32("ms"), [81068000, None], [81068000000, None]),
+    (TimeType.get(), pa.time64("ns"), [81068000000000, None], [81068000000, None])])
+def test_apply_batch_converts_temporal_units(test_type, arrow_type, values, iceberg_values):
+    bucket = Bucket.get(test_type, 100)
+    result = bucket.apply_batch(pa.array(values, type=arrow_type))
+    assert result.to_pylist() == [bucket.apply(value) for value in iceberg_values]
+
+
+def test_get_returns_shared_instance():
+    assert Bucket.get(LongType.get(), 16) is Bucket.get(LongType.get(), 16)
+    assert Bucket.get(TimestampType.without_timezone(), 16) is not Bucket.get(LongType.get(), 16)
+    assert Bucket.get(LongType.get(), 16) is not Bucket.get(LongType.get(), 32)
+
+
+def test_uuid_apply_matches_hash():
+    value = uuid.UUID("f79c3e09-677c-4bbd-a479-3f349cb785e7")
+    for num_buckets in [16, 100]:
+        bucket = Bucket.get(UUIDType.get(), num_buckets)
+        assert bucket.hash(value) == 1488055340
+        assert bucket.apply(value) == (1488055340 & 2147483647) % num_buckets
+
+
+@pytest.mark.parametrize("num_buckets", [16, 100])
+def test_uuid_apply_array_and_batch(num_buckets):
+    values = [uuid.UUID("f79c3e09-677c-4bbd-a479-3f349cb785e7"), uuid.UUID(int=0), uuid.UUID(int=2 ** 128 - 1)]
+    values += [uuid.uuid4() for _ in range(100)]
+    bucket = Bucket.get(UUIDType.get(), num_buckets)
+    expected = [bucket.apply(value) for value in values]
+
+    halves = np.array([(value.int >> 64, value.int & 0xFFFFFFFFFFFFFFFF) for value in values], dtype=np.uint64)
+    assert bucket.apply_array(halves).tolist() == expected
+
+    arrow_values = pa.array([value.bytes for value in values] + [None], type=pa.binary(16))
+    assert bucket.apply_batch(arrow_values).to_pylist() == expected + [None]
+    assert bucket.apply_batch(arrow_values.slice(3, 10)).to_pylist() == expected[3:13]
+
+
+@pytest.mark.parametrize("values", [
+    pa.array([uuid.UUID(int=i).bytes for i in range(3)], type=pa.binary()),
+    pa.array([uuid.UUID(int=i).bytes[:8] for i in range(3)], type=pa.binary(8))])
+def test_uuid_apply_batch_requires_fixed_16(values):
+    with pytest.raises(RuntimeError):
+        Bucket.get(UUIDType.get(), 16).apply_batch(values)
+
+
+def test_apply_array_empty():
+    assert Bucket.get(LongType.get(), 16).apply_array(np.array([], dtype=np.int64)).tolist() == []
+    assert Bucket.get(UUIDType.get(), 16).apply_batch(pa.array([], type=pa.binary(16))).to_pylist() == []
+
+
+def test_equality_and_hash():
+    assert BucketFloat(16) == BucketFloat(16)
+    assert hash(BucketFloat(16)) == hash(BucketFloat(16))
+    assert BucketFloat(16) != BucketFloat(32)
+    assert BucketFloat(16) == BucketDouble(16)
+    assert hash(BucketFloat(16)) == hash(BucketDouble(16))
+    assert Bucket.get(IntegerType.get(), 16) == Bucket.get(LongType.get(), 16)
+    assert BucketFloat(16) != "bucket[16]"
+
+
+@pytest.mark.parametrize("num_buckets", [16, 100])
+def test_partition_indices(num_buckets):
+    values = np.arange(-5000, 5000, 3, dtype=np.int64)
+    bucket = Bucket.get(LongType.get(), num_buckets)
+    row_to_partition, counts = bucket.partition_indices(values)
+    assert row_to_partition.tolist() == [bucket.apply(value) for value in values.tolist()]
+    assert len(counts) == num_buckets
+    assert counts.sum() == len(values)
+    assert counts[7] == (row_to_partition == 7).sum()
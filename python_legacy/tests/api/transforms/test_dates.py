@@ -16,9 +16,12 @@
 # under the License.
 
 
+from datetime import date
+
 from iceberg.api.expressions import Literal
 from iceberg.api.transforms import Transforms
 from iceberg.api.types import DateType
+import pyarrow as pa
 import pytest
 
 
@@ -42,3 +45,21 @@ def test_date_to_human_string(transform_gran, expected):
 def test_null_human_string(transform_gran):
     type_var = DateType.get()
     assert transform_gran(type_var).to_human_string(None) == "null"
+
+
+def test_equality_and_hash():
+    assert Transforms.day(DateType.get()) == Transforms.day(DateType.get())
+    assert Transforms.day(DateType.get()) != Transforms.month(DateType.get())
+    assert len({Transforms.day(DateType.get()), Transforms.day(DateType.get()), Transforms.year(DateType.get())}) == 2
+
+
+@pytest.mark.parametrize("transform_gran,expected", [
+    (Transforms.year, [47, None, 0, -1]),
+    (Transforms.month, [575, None, 0, -1]),
+    (Transforms.day, [17501, None, 0, -1])])
+@pytest.mark.parametrize("arrow_type", [pa.date32(), pa.date64()])
+def test_apply_batch(transform_gran, expected, arrow_type):
+    values = pa.array([date(2017, 12, 1), None, date(1970, 1, 1), date(1969, 12, 31)], type=arrow_type)
+    result = transform_gran(DateType.get()).apply_batch(values)
+    assert result.type == pa.int32()
+    assert result.to_pylist() == expected
@@ -26,6 +26,7 @@ from iceberg.api.types import (DateType,
                                StringType,
                                TimestampType,
                                TimeType)
+import pyarrow as pa
 
 
 def test_null_human_string():
@@ -91,3 +92,15 @@ def test_big_decimal_to_human_string():
     dec_var = Decimal(dec_str)
 
     assert identity.to_human_string(dec_var) == dec_str
+
+
+def test_apply_batch_returns_input():
+    values = pa.array([1, None, 3], type=pa.int64())
+    assert Transforms.identity(LongType.get()).apply_batch(values) is values
+
+
+def test_get_returns_shared_instance():
+    assert Identity.get(LongType.get()) is Identity.get(LongType.get())
+    assert Identity.get(TimestampType.with_timezone()) is not Identity.get(TimestampType.without_timezone())
+    assert Identity.get(DecimalType.of(9, 2)) is not Identity.get(DecimalType.of(9, 3))
+    assert hash(Identity.get(StringType.get())) == hash(Identity(StringType.get()))
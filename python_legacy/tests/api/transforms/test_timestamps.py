@@ -15,9 +15,12 @@
 # specific language governing permissions and limitations
 # under the License.
 
+from datetime import datetime
+
 from iceberg.api.expressions import Literal
 from iceberg.api.transforms import Transforms
 from iceberg.api.types import TimestampType
+import pyarrow as pa
 import pytest
 
 
@@ -44,3 +47,16 @@ def test_ts_to_human_string(lit, type_var, transform_gran, expected):
 def test_null_human_string(transform_gran):
     type_var = TimestampType.with_timezone()
     assert "null" == transform_gran(type_var).to_human_string(None)
+
+
+@pytest.mark.parametrize("transform_gran,expected", [
+    (Transforms.year, [47, None, 0]),
+    (Transforms.month, [575, None, 0]),
+    (Transforms.day, [17501, None, 0]),
+    (Transforms.hour, [420042, None, 0])])
+@pytest.mark.parametrize("arrow_type", [pa.timestamp("ms"), pa.timestamp("us")])
+def test_apply_batch(transform_gran, expected, arrow_type):
+    values = pa.array([datetime(2017, 12, 1, 18, 12, 55), None, datetime(1970, 1, 1)], type=arrow_type)
+    result = transform_gran(TimestampType.without_timezone()).apply_batch(values)
+    assert result.type == pa.int32()
+    assert result.to_pylist() == expected
@@ -0,0 +1,46 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from iceberg.api.transforms import (Bucket,
+                                    Transforms,
+                                    Truncate)
+from iceberg.api.transforms.unknown_transform import UnknownTransform
+from iceberg.api.types import (IntegerType,
+                               LongType,
+                               StringType)
+import pytest
+
+
+@pytest.mark.parametrize("transform,expected", [
+    ("bucket[16]", Bucket.get(LongType.get(), 16)),
+    ("BUCKET[16]", Bucket.get(LongType.get(), 16)),
+    ("truncate[10]", Truncate.get(LongType.get(), 10)),
+    ("Truncate[10]", Truncate.get(LongType.get(), 10))])
+def test_from_string_with_width(transform, expected):
+    assert Transforms.from_string(LongType.get(), transform) is expected
+
+
+def test_from_string_unknown_width_transform():
+    transform = Transforms.from_string(IntegerType.get(), "zorder[3]")
+    assert isinstance(transform, UnknownTransform)
+    assert str(transform) == "zorder[3]"
+
+
+def test_from_string_round_trip():
+    for transform in [Transforms.bucket(StringType.get(), 128), Transforms.truncate(StringType.get(), 4),
+                      Transforms.identity(StringType.get()), Transforms.always_null()]:
+        assert Transforms.from_string(StringType.get(), str(transform)) == transform
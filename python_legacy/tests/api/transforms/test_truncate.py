@@ -18,10 +18,13 @@
 from decimal import Decimal
 
 from iceberg.api.transforms import Truncate
-from iceberg.api.types import (DecimalType,
+from iceberg.api.types import (BinaryType,
+                               DecimalType,
                                IntegerType,
                                LongType,
                                StringType)
+import numpy as np
+import pyarrow as pa
 import pytest
 
 
@@ -57,3 +60,81 @@ def test_truncate_decimal(input_var, expected):
 def test_truncate_string(input_var, expected):
     trunc = Truncate.get(StringType.get(), 5)
     assert trunc.apply(input_var) == expected
+
+
+@pytest.mark.parametrize("type_var", [IntegerType.get(), LongType.get(), DecimalType.of(9, 2), StringType.get()])
+def test_truncate_null(type_var):
+    assert Truncate.get(type_var, 10).apply(None) is None
+
+
+@pytest.mark.parametrize("type_var,input_var,expected", [
+    (IntegerType.get(), 0, 0),
+    (LongType.get(), 0, 0),
+    (StringType.get(), "", "")])
+def test_truncate_falsy_values(type_var, input_var, expected):
+    assert Truncate.get(type_var, 10).apply(input_var) == expected
+
+
+@pytest.mark.parametrize("type_var,dtype", [(IntegerType.get(), np.int32), (LongType.get(), np.int64)])
+def test_truncate_integer_array(type_var, dtype):
+    values = [1, 5, 9, 10, 11, -1, -10, -12, 0]
+    trunc = Truncate.get(type_var, 10)
+    result = trunc.apply_array(np.array(values, dtype=dtype))
+    assert result.dtype == dtype
+    assert result.tolist() == [trunc.apply(value) for value in values]
+
+
+def test_truncate_decimal_array():
+    values = [Decimal("12.34"), Decimal("0.05"), Decimal("-0.05")]
+    trunc = Truncate.get(DecimalType.of(9, 2), 10)
+    assert trunc.apply_array(np.array(values, dtype=object)).tolist() == [trunc.apply(value) for value in values]
+
+
+def test_truncate_string_array():
+    values = ["abcdefg", "abc", "", "éééééé", "ab\x00", "abcd\x00\x00"]
+    trunc = Truncate.get(StringType.get(), 5)
+    assert trunc.apply_array(np.array(values, dtype=object)).tolist() == [trunc.apply(value) for value in values]
+    assert Truncate.get(StringType.get(), 100000).apply_array(np.array(values, dtype=object)).tolist() == values
+
+
+@pytest.mark.parametrize("type_var,arrow_type,values", [
+    (IntegerType.get(), pa.int32(), [1, None, -12, 0]),
+    (LongType.get(), pa.int64(), [11, None, -1]),
+    (DecimalType.of(9, 2), pa.decimal128(9, 2), [Decimal("12.34"), None, Decimal("-0.05")]),
+    (StringType.get(), pa.string(), ["abcdefghijklm", None, "", "ab\x00"])])
+def test_truncate_batch(type_var, arrow_type, values):
+    trunc = Truncate.get(type_var, 10)
+    result = trunc.apply_batch(pa.array(values, type=arrow_type))
+    assert result.type == arrow_type
+    assert result.to_pylist() == [trunc.apply(value) for value in values]
+
+
+def test_get_returns_shared_instance():
+    assert Truncate.get(StringType.get(), 10) is Truncate.get(StringType.get(), 10)
+    assert Truncate.get(IntegerType.get(), 10) is not Truncate.get(LongType.get(), 10)
+    assert Truncate.get(IntegerType.get(), 10) is not Truncate.get(IntegerType.get(), 100)
+
+
+@pytest.mark.parametrize("input_var,expected", [
+    (b"abcdefg", b"abcde"),
+    (b"abc", b"abc"),
+    (b"", b"")])
+def test_truncate_binary(input_var, expected):
+    trunc = Truncate.get(BinaryType.get(), 5)
+    assert trunc.apply(input_var) == expected
+    assert trunc.apply(None) is None
+
+
+def test_truncate_binary_view_shares_storage():
+    value = bytearray(b"abcdefghij" * 100)
+    view = Truncate.get(BinaryType.get(), 5).apply_view(value)
+    assert view == b"abcde"
+    value[0:1] = b"z"
+    assert view == b"zbcde"
+
+
+def test_truncate_binary_batch():
+    values = pa.array([b"abcdefghijklm", None, b""], type=pa.binary())
+    result = Truncate.get(BinaryType.get(), 10).apply_batch(values)
+    assert result.type == pa.binary()
+    assert result.to_pylist() == [b"abcdefghij", None, b""]